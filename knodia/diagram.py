@@ -2,9 +2,11 @@ import numpy as np
 from matplotlib import get_backend
 from matplotlib import pyplot as plt
 from matplotlib.patches import Polygon
+from shapely.creation import linestrings
 from shapely.geometry import LineString
 from shapely.ops import polygonize, unary_union
 from traits.api import (
+    Any,
     Bool,
     HasStrictTraits,
     Instance,
@@ -17,24 +19,33 @@ from traits.api import (
 
 from knodia.interactor.polygon_interactor import PolygonInteractor
 
+# The default diagram is a unknot triangle. Built once: LineStrings are immutable.
+_DEFAULT_LINE = linestrings([[0, 0], [1, 0], [0.5, 0.866], [0, 0]])
+
 
 class Diagram(HasStrictTraits):
     """ A projection of a knot (in R3) onto the plane. """
 
     #: A line string representation of the knot diagram without over/under decorations.
-    #: Will always return a LineString, but it can be set using a list of coordinates.
-    #: If the first and last point don't match, the line will be closed automatically
-    #: upon setting.
-    line = Property(Union(Instance(LineString), List()), observe="_line")
+    #: Will always return a LineString, but it can be set using a list or an array of
+    #: coordinates. If the first and last point don't match, the line will be closed
+    #: automatically upon setting.
+    line = Property(
+        Union(Instance(LineString), List(), Instance(np.ndarray)), observe="_line"
+    )
     _line = Instance(LineString)
 
+    #: Coordinates of ``_line`` as a (N, 2) array, for internal consumers.
+    _line_arr = Property(observe="_line")
+
     #: Simple polygons representing the individual regions defined by the diagram. The
     #: region containing infinity is not included (see ``boundary``).
     regions = Property(observe="line")
 
     #: Line encompassing the diagram. One of the two region it defines is the region
-    #: containing infinity.
-    boundary = Property(Union(Instance(LineString)), observe="regions")
+    #: containing infinity. To test many geometries against the enclosed area, prepare
+    #: it once: ``shapely.prepared.prep(shapely.geometry.Polygon(boundary))``.
+    boundary = Property(Union(Instance(LineString)), observe="_line")
 
     #: Index to one of the points in "line" that defines a pair of Kauffman excluded
     #: regions.
@@ -43,29 +54,37 @@ class Diagram(HasStrictTraits):
     #: Whether there is an open editor.
     _editing = Bool(False)
 
+    #: Latest (coordinates, Kauffman point) sent by the editor, not yet applied.
+    _pending_update = Any()
+
+    #: Editor timer applying ``_pending_update`` once the edits pause.
+    _update_timer = Any()
+
     def _set_line(self, line):
         if not isinstance(line, LineString):
             try:
-                line = LineString(line)
+                line = linestrings(np.asarray(line, dtype=float))
             except Exception:
                 raise ValueError(
-                    "`line` must be passed as a LineString or a list of coordinates"
+                    "`line` must be passed as a LineString or a list or array of "
+                    "coordinates"
                 )
 
-        # ensure line is closed
-        x, y = line.coords.xy
-        if (x[0], y[0]) != (x[-1], y[-1]):
-            x = list(x) + [x[0]]
-            y = list(y) + [y[0]]
-            line = LineString(zip(x, y))
+        # ensure line is closed (is_closed does not copy the coordinates)
+        if not line.is_closed:
+            coords = np.asarray(line.coords)
+            line = linestrings(np.vstack((coords, coords[:1])))
         self._line = line
 
     def _get_line(self):
         return self._line
 
+    @cached_property
+    def _get__line_arr(self):
+        return np.asarray(self._line.coords)
+
     def __line_default(self):
-        # The default diagram is a unknot triangle
-        return LineString(([0, 0], [1, 0], [0.5, 0.866], [0, 0]))
+        return _DEFAULT_LINE
 
     @cached_property
     def _get_regions(self):
@@ -73,18 +92,10 @@ class Diagram(HasStrictTraits):
         # https://shapely.readthedocs.io/en/stable/manual.html#shapely.ops.unary_union
         # Here we use it to clear overlapping geometry (which is expected, for knots)
         # and separate the diagram area into disjoint regions.
-        regions = []
-        for region in polygonize(unary_union(self.line)):
-            if not region.is_simple:
-                # This should not happen
-                raise ValueError("A non-simple region was generated.")
-            regions.append(region)
-        # TODO: make a decent sorting, and test it
-        try:
-            toret = sorted(regions, key=lambda r: list(r.boundary.coords))
-        except Exception:
-            toret = regions
-        return toret
+        # polygonize only generates simple polygons, no need to check them.
+        regions = polygonize(unary_union(self.line))
+        # Deterministic order: by bounds (min x, then min y, max x, max y)
+        return sorted(regions, key=lambda r: r.bounds)
 
     @cached_property
     def _get_boundary(self):
@@ -100,9 +111,7 @@ class Diagram(HasStrictTraits):
             raise RuntimeError(
                 "The diagram is already being edited. " "Close all other editors first."
             )
-        editing_poly = Polygon(
-            np.column_stack(self.line.xy)[:-1], animated=True, fill=False
-        )
+        editing_poly = Polygon(self._line_arr[:-1], animated=True, fill=False)
 
         fig, ax = plt.subplots(figsize=(5, 5))
         # Remove all but the X, Y spy ("!label" and "!label2").
@@ -120,7 +129,7 @@ class Diagram(HasStrictTraits):
             poly_callback=self._update_line,
         )
 
-        xl, yl = _lims(self.line.xy)
+        xl, yl = _lims(self._line_arr)
         ax.set_xlim(xl)
         ax.set_ylim(yl)
         ax.set_title(
@@ -132,19 +141,42 @@ class Diagram(HasStrictTraits):
         plt.show()
 
     def _update_line(self, poly, x_point):
-        """ Called every time the polygon is updated in a interactor."""
-        self.line = poly.xy.tolist()
+        """ Called every time the polygon is updated in a interactor.
+
+        Updates are applied once no other update arrived for 50 ms, so that a burst
+        of edits recomputes the regions only once.
+        """
+        # copy, as the interactor keeps editing the polygon vertices in place
+        self._pending_update = (poly.xy.copy(), x_point)
+        if self._update_timer is None:
+            self._update_timer = poly.figure.canvas.new_timer(interval=50)
+            self._update_timer.single_shot = True
+            self._update_timer.add_callback(self._apply_pending_update)
+        # (re)start the countdown
+        self._update_timer.stop()
+        self._update_timer.start()
+
+    def _apply_pending_update(self):
+        if self._pending_update is None:
+            return
+        line, x_point = self._pending_update
+        self._pending_update = None
+        self.line = line
         self.kauffman_point = x_point
 
     def _visual_edit_finished(self, event):
+        if self._update_timer is not None:
+            self._update_timer.stop()
+            self._update_timer = None
+        self._apply_pending_update()
         self._editing = False
 
 
-def _lims(xy):
-    def _mid_and_span(pts):
-        return (max(pts) + min(pts)) / 2, (max(pts) - min(pts)) / 2
-
-    xm, xs, ym, ys = *_mid_and_span(xy[0]), *_mid_and_span(xy[1])
-    span = max(xs, ys) * 1.1
+def _lims(coords):
+    # no copy for the (N, 2) float arrays of ``_line_arr``
+    coords = np.asarray(coords, dtype=float)
+    lo, hi = coords.min(axis=0), coords.max(axis=0)
+    mid = (lo + hi) / 2
+    span = (hi - lo).max() / 2 * 1.1
 
-    return (xm - span, xm + span), (ym - span, ym + span)
+    return (mid[0] - span, mid[0] + span), (mid[1] - span, mid[1] + span)
@@ -10,34 +10,32 @@
 import numpy as np
 from matplotlib.artist import Artist
 from matplotlib.lines import Line2D
+from matplotlib.transforms import Bbox
 
 
-def dist(x, y):
+def dist_point_to_segments(p, s0, s1):
     """
-    Return the distance between two points.
+    Get the distance of a point to each of a sequence of segments.
+      *p* is an *xy* sequence, *s0* and *s1* are (N, 2) arrays of segment ends
+    This algorithm from
+    http://geomalgorithms.com/a02-_lines.html
     """
-    d = x - y
-    return np.sqrt(np.dot(d, d))
+    v = s1 - s0
+    return _dist_point_to_segments(p, s0, v, (v * v).sum(axis=1))
 
 
-def dist_point_to_segment(p, s0, s1):
+def _dist_point_to_segments(p, s0, v, c2):
     """
-    Get the distance of a point to a segment.
-      *p*, *s0*, *s1* are *xy* sequences
-    This algorithm from
-    http://geomalgorithms.com/a02-_lines.html
+    Same as ``dist_point_to_segments``, given the segment vectors *v* (s1 - s0) and
+    their squared lengths *c2*.
     """
-    v = s1 - s0
     w = p - s0
-    c1 = np.dot(w, v)
-    if c1 <= 0:
-        return dist(p, s0)
-    c2 = np.dot(v, v)
-    if c2 <= c1:
-        return dist(p, s1)
-    b = c1 / c2
-    pb = s0 + b * v
-    return dist(p, pb)
+    c1 = (w * v).sum(axis=1)
+    # Parameter of the projection of p on each segment, clipped to the segment
+    # (c1 <= 0: closest to s0, c2 <= c1: closest to s1).
+    b = np.clip(c1 / np.where(c2 > 0, c2, 1), 0, 1)
+    pb = s0 + b[:, np.newaxis] * v
+    return np.hypot(*(p - pb).T)
 
 
 class PolygonInteractor:
@@ -72,7 +70,14 @@ class PolygonInteractor:
 
         self.x_point = x_point
 
-        x, y = zip(*self.poly.xy)
+        # The vertices live in an oversized buffer, so that insertions and deletions
+        # only shift the affected suffix in place. ``poly.xy`` is a view on it.
+        self._n = len(self.poly.xy)
+        self._xy = np.empty((max(64, 2 * self._n), 2))
+        self._xy[: self._n] = self.poly.xy
+        self.poly.xy = self._xy[: self._n]
+
+        x, y = self.poly.xy[:, 0], self.poly.xy[:, 1]
         self.line = Line2D(x, y, marker="o", markerfacecolor="r", animated=True)
         self.ax.add_line(self.line)
 
@@ -84,6 +89,12 @@ class PolygonInteractor:
 
         self.cid = self.poly.add_callback(self.poly_changed)
         self._ind = None  # the active vert
+        self._xyt = None  # the vertices in display coords, computed lazily
+        self._seg_v = None  # the segment vectors in display coords, also lazy
+        self._seg_c2 = None  # and their squared lengths
+
+        ax.callbacks.connect("xlim_changed", self._invalidate_display_coords)
+        ax.callbacks.connect("ylim_changed", self._invalidate_display_coords)
 
         canvas.mpl_connect("draw_event", self.on_draw)
         canvas.mpl_connect("button_press_event", self.on_button_press)
@@ -93,6 +104,7 @@ class PolygonInteractor:
         self.canvas = canvas
 
     def on_draw(self, event):
+        self._invalidate_display_coords()
         self.background = self.canvas.copy_from_bbox(self.ax.bbox)
         self.ax.draw_artist(self.poly)
         self.ax.draw_artist(self.line)
@@ -105,18 +117,80 @@ class PolygonInteractor:
         Artist.update_from(self.line, poly)
         self.line.set_visible(vis)  # don't use the poly visibility state
 
+    def _set_vertices(self):
+        """Propagate the vertex buffer to the polygon and to the line."""
+        xy = self._xy[: self._n]
+        self.poly.xy = xy
+        self.line.set_data(xy[:, 0], xy[:, 1])
+
+    def _invalidate_display_coords(self, *args):
+        self._xyt = self._seg_v = self._seg_c2 = None
+
+    def _display_coords(self):
+        """
+        Return the vertices in display coords. They are cached until the vertices
+        or the view change.
+        """
+        if self._xyt is None:
+            self._xyt = self.poly.get_transform().transform(self.poly.xy)
+        return self._xyt
+
+    def _display_segments(self):
+        """
+        Return the segment vectors in display coords and their squared lengths,
+        cached along with the display coords.
+        """
+        if self._seg_v is None:
+            xyt = self._display_coords()
+            self._seg_v = xyt[1:] - xyt[:-1]
+            self._seg_c2 = (self._seg_v**2).sum(axis=1)
+        return self._seg_v, self._seg_c2
+
+    def _move_display_coords(self, inds, xy):
+        """
+        Update the cached display coords after moving the vertices *inds* to *xy*,
+        without transforming the other vertices.
+        """
+        if self._xyt is None:
+            return
+        self._xyt[inds] = self.poly.get_transform().transform(xy)
+        if self._seg_v is None:
+            return
+        # only the segments starting or ending at the moved vertices changed
+        segs = {j for i in inds for j in (i - 1, i) if 0 <= j < len(self._seg_v)}
+        segs = np.array(sorted(segs))
+        self._seg_v[segs] = self._xyt[segs + 1] - self._xyt[segs]
+        self._seg_c2[segs] = (self._seg_v[segs] ** 2).sum(axis=1)
+
+    def _insert_vertex(self, ind, xy):
+        """Insert a vertex at index *ind*, growing the buffer if it is full."""
+        if self._n == len(self._xy):
+            grown = np.empty((2 * len(self._xy), 2))
+            grown[: self._n] = self._xy[: self._n]
+            self._xy = grown
+        self._xy[ind + 1 : self._n + 1] = self._xy[ind : self._n]
+        self._xy[ind] = xy
+        self._n += 1
+        self._set_vertices()
+        self._invalidate_display_coords()
+
+    def _delete_vertex(self, ind):
+        """Delete the vertex at index *ind*."""
+        self._xy[ind : self._n - 1] = self._xy[ind + 1 : self._n]
+        self._n -= 1
+        self._set_vertices()
+        self._invalidate_display_coords()
+
     def get_ind_under_point(self, event):
         """
         Return the index of the point closest to the event position or *None*
         if no point is within ``self.epsilon`` to the event position.
         """
         # display coords
-        xy = np.asarray(self.poly.xy)
-        xyt = self.poly.get_transform().transform(xy)
+        xyt = self._display_coords()
         xt, yt = xyt[:, 0], xyt[:, 1]
         d = np.hypot(xt - event.x, yt - event.y)
-        (indseq,) = np.nonzero(d == d.min())
-        ind = indseq[0]
+        ind = int(np.argmin(d))
 
         if d[ind] >= self.epsilon:
             ind = None
@@ -146,8 +220,7 @@ class PolygonInteractor:
             ind = self.get_ind_under_point(event)
             if ind is not None and ind != 0:
                 # TODO make it possible to remove point with ind == 0
-                self.poly.xy = np.delete(self.poly.xy, ind, axis=0)
-                self.line.set_data(zip(*self.poly.xy))
+                self._delete_vertex(ind)
                 if ind == self.x_point:
                     self.x_point = None
                     self.x_marker.set_data([[], []])
@@ -155,24 +228,20 @@ class PolygonInteractor:
                     self.x_point -= 1
                 self.poly_callback(self.poly, self.x_point)
         elif event.key == "i" or event.key == "x":
-            xys = self.poly.get_transform().transform(self.poly.xy)
+            xys = self._display_coords()
+            v, c2 = self._display_segments()
             p = event.x, event.y  # display coords
-            for i in range(len(xys) - 1):
-                s0 = xys[i]
-                s1 = xys[i + 1]
-                d = dist_point_to_segment(p, s0, s1)
-                if d <= self.epsilon:
-                    self.poly.xy = np.insert(
-                        self.poly.xy, i + 1, [event.xdata, event.ydata], axis=0
-                    )
-                    self.line.set_data(zip(*self.poly.xy))
-                    if event.key == "x":
-                        self.x_point = i + 1
-                        self.x_marker.set_data([event.xdata, event.ydata])
-                    elif self.x_point is not None and self.x_point > i:
-                        self.x_point += 1
-                    self.poly_callback(self.poly, self.x_point)
-                    break
+            d = _dist_point_to_segments(p, xys[:-1], v, c2)
+            (hits,) = np.nonzero(d <= self.epsilon)
+            if len(hits):
+                i = int(hits[0])
+                self._insert_vertex(i + 1, (event.xdata, event.ydata))
+                if event.key == "x":
+                    self.x_point = i + 1
+                    self.x_marker.set_data([event.xdata], [event.ydata])
+                elif self.x_point is not None and self.x_point > i:
+                    self.x_point += 1
+                self.poly_callback(self.poly, self.x_point)
         if self.line.stale:
             self.canvas.draw_idle()
 
@@ -186,17 +255,31 @@ class PolygonInteractor:
             return
         x, y = event.xdata, event.ydata
 
-        self.poly.xy[self._ind] = x, y
-        if self._ind == 0:
-            self.poly.xy[-1] = x, y
-        elif self._ind == len(self.poly.xy) - 1:
-            self.poly.xy[0] = x, y
-        self.line.set_data(zip(*self.poly.xy))
+        # the first and last vertices are the same point
+        moved = [0, self._n - 1] if self._ind in (0, self._n - 1) else [self._ind]
+        # the moved vertices (before moving) and their neighbours delimit the region
+        # to redraw, together with the new position
+        around = [j for i in moved for j in (i - 1, i, i + 1) if 0 <= j < self._n]
+        dirty = [self._display_coords()[around]]
+        self._xy[moved] = x, y
+        self._set_vertices()
+        self._move_display_coords(moved, (x, y))
+        dirty.append(self._xyt[moved])
         if self._ind == self.x_point:
-            self.x_marker.set_data([x, y])
+            self.x_marker.set_data([x], [y])
 
         self.canvas.restore_region(self.background)
         self.ax.draw_artist(self.poly)
         self.ax.draw_artist(self.line)
         self.ax.draw_artist(self.x_marker)
-        self.canvas.blit(self.ax.bbox)
+        self.canvas.blit(self._dirty_bbox(np.vstack(dirty), self.x_point in moved))
+
+    def _dirty_bbox(self, xyt, with_x_marker):
+        """
+        Return the display bbox enclosing the points *xyt* and the markers drawn
+        on them, to blit only that part of the axes.
+        """
+        markers = [self.line, self.x_marker] if with_x_marker else [self.line]
+        pad = max(m.get_markersize() + m.get_linewidth() for m in markers)
+        pad *= self.canvas.figure.dpi / 72  # points to pixels
+        return Bbox.from_extents(*(xyt.min(axis=0) - pad), *(xyt.max(axis=0) + pad))
@@ -1,9 +1,13 @@
 import unittest
 
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.patches import Polygon as MplPolygon
 from shapely.geometry import LineString, Polygon
+from shapely.prepared import prep
 from traits.api import TraitError
 
-from knodia.diagram import Diagram
+from knodia.diagram import Diagram, _lims
 
 TREFOIL = [
     (0, 0),
@@ -47,6 +51,8 @@ class TestDiagram(unittest.TestCase):
 
         # Then
         self.assertEqual(len(resulting.coords), len(close_trefoil.coords))
+        # the very same object is kept
+        self.assertIs(resulting, close_trefoil)
 
     def test_create_from_coords(self):
         # When/Then
@@ -55,6 +61,14 @@ class TestDiagram(unittest.TestCase):
         except Exception:
             self.fail("Should have worked")
 
+    def test_create_from_array(self):
+        # When
+        diagram = Diagram(line=np.array(TREFOIL))
+
+        # Then
+        self.assertTrue(diagram.line.is_closed)
+        self.assertEqual(len(diagram.line.coords), len(TREFOIL) + 1)
+
     def test_create_from_other_types(self):
         # When/Then
         with self.assertRaises(TraitError):
@@ -74,10 +88,28 @@ class TestDiagram(unittest.TestCase):
         self.assertGreater(len(diagram._line.coords), 2)
         self.assertEqual(diagram._line.coords[0], diagram._line.coords[-1])
 
+    def test_line_arr(self):
+        diagram = Diagram(line=TREFOIL)
+        line_arr = diagram._line_arr
+
+        self.assertEqual(line_arr.shape, (len(TREFOIL) + 1, 2))
+        self.assertEqual(tuple(line_arr[-1]), (0.0, 0.0))
+
+        # check that is cached, and that it updates
+        self.assertIs(diagram._line_arr, line_arr)
+        diagram.line = TREFOIL[:4]
+        self.assertEqual(diagram._line_arr.shape, (5, 2))
+
     def test_regions(self):
         diagram = Diagram(line=TREFOIL)
         regions = diagram.regions
         self.assertEqual(len(regions), 4)
+        for region in regions:
+            self.assertTrue(region.is_simple)
+
+        # sorted by bounds
+        bounds = [region.bounds for region in regions]
+        self.assertEqual(bounds, sorted(bounds))
 
         # check that is cached (same object when requesting again)
         self.assertIs(diagram.regions[0], regions[0])
@@ -100,6 +132,50 @@ class TestDiagram(unittest.TestCase):
         self.assertTrue(boundary.is_simple)
 
         # contains all region
-        filled_boundary = Polygon(boundary)
+        filled_boundary = prep(Polygon(boundary))
         for region in diagram.regions:
             self.assertTrue(filled_boundary.contains(region))
+
+        # check that it updates
+        diagram.line = TREFOIL[:4]
+        self.assertIsNot(diagram.boundary, boundary)
+
+    def test_editor_updates_are_applied_when_editor_closes(self):
+        # Given
+        diagram = Diagram(line=TREFOIL)
+        poly = MplPolygon(np.array(TREFOIL[:4]))
+        Figure().add_subplot().add_patch(poly)
+
+        # When
+        diagram._update_line(poly, 1)
+
+        # Then
+        # the update is pending (the timer does not run without a GUI event loop)
+        self.assertEqual(len(diagram.line.coords), len(TREFOIL) + 1)
+        self.assertIsNone(diagram.kauffman_point)
+
+        # When
+        diagram._visual_edit_finished(None)
+
+        # Then
+        self.assertEqual(len(diagram.line.coords), 5)
+        self.assertEqual(diagram.kauffman_point, 1)
+
+
+class TestLims(unittest.TestCase):
+    def test_square_limits_around_coords(self):
+        # Given
+        coords = np.array([(0, 0), (4, 0), (4, 2), (0, 2), (0, 0)], dtype=float)
+
+        # When
+        (x0, x1), (y0, y1) = _lims(coords)
+
+        # Then
+        # centered on the coords, same span on both axes, with a 10% margin
+        self.assertAlmostEqual((x0 + x1) / 2, 2)
+        self.assertAlmostEqual((y0 + y1) / 2, 1)
+        self.assertAlmostEqual(x1 - x0, 4.4)
+        self.assertAlmostEqual(y1 - y0, 4.4)
+
+        # and the same from a list of coordinates
+        self.assertEqual(_lims(coords.tolist()), _lims(coords))
@@ -0,0 +1,169 @@
+import unittest
+
+import numpy as np
+from matplotlib.backend_bases import KeyEvent, MouseEvent
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Polygon
+
+from knodia.interactor.polygon_interactor import (
+    PolygonInteractor,
+    dist_point_to_segments,
+)
+
+SQUARE = [(0, 0), (4, 0), (4, 4), (0, 4)]
+
+
+class TestDistPointToSegments(unittest.TestCase):
+    def test_distances(self):
+        # Given
+        s0 = np.array([(0, 0), (0, 0), (0, 0), (2, 2)], dtype=float)
+        s1 = np.array([(2, 0), (2, 0), (2, 0), (2, 2)], dtype=float)
+        points = [(1, 1), (-3, 4), (5, 4), (2, 3)]
+        # projection inside, before s0, after s1, degenerate segment
+        expected = [1.0, 5.0, 5.0, 1.0]
+
+        for i, (p, distance) in enumerate(zip(points, expected)):
+            # When
+            d = dist_point_to_segments(p, s0[i : i + 1], s1[i : i + 1])
+
+            # Then
+            self.assertAlmostEqual(d[0], distance)
+
+    def test_one_distance_per_segment(self):
+        # Given
+        xys = np.array([(0, 0), (4, 0), (4, 4), (0, 4), (0, 0)], dtype=float)
+
+        # When
+        d = dist_point_to_segments((1, 1), xys[:-1], xys[1:])
+
+        # Then
+        np.testing.assert_allclose(d, [1, 3, 3, 1])
+
+
+class TestPolygonInteractor(unittest.TestCase):
+    def setUp(self):
+        # A large figure, so that vertices 0.05 apart are further than epsilon
+        figure = Figure(figsize=(20, 20))
+        self.canvas = FigureCanvasAgg(figure)
+        self.ax = figure.add_subplot()
+        self.ax.set_xlim(-0.5, 4.5)
+        self.ax.set_ylim(-0.5, 4.5)
+        self.poly = Polygon(SQUARE, animated=True, fill=False)
+        self.ax.add_patch(self.poly)
+        self.callbacks = []
+        self.interactor = PolygonInteractor(
+            self.ax,
+            self.poly,
+            x_point=None,
+            poly_callback=lambda poly, x_point: self.callbacks.append(
+                (poly.xy.copy(), x_point)
+            ),
+        )
+        self.canvas.draw()
+
+    def press_key(self, key, xdata, ydata):
+        x, y = self.ax.transData.transform((xdata, ydata))
+        event = KeyEvent("key_press_event", self.canvas, key, x, y)
+        self.interactor.on_key_press(event)
+
+    def drag(self, start, end):
+        for name, handler, (xdata, ydata) in [
+            ("button_press_event", self.interactor.on_button_press, start),
+            ("motion_notify_event", self.interactor.on_mouse_move, end),
+            ("button_release_event", self.interactor.on_button_release, end),
+        ]:
+            x, y = self.ax.transData.transform((xdata, ydata))
+            handler(MouseEvent(name, self.canvas, x, y, button=1))
+
+    def assert_vertices(self, expected):
+        # event data coords go through the inverse display transform
+        for xy in [
+            self.poly.xy,
+            self.interactor.line.get_xydata(),
+            self.callbacks[-1][0],
+        ]:
+            np.testing.assert_allclose(xy, expected, atol=1e-9)
+
+    def test_insert_on_last_segment(self):
+        # When
+        self.press_key("i", 0, 2)
+
+        # Then
+        self.assert_vertices(SQUARE + [(0, 2), (0, 0)])
+
+    def test_insert_past_initial_capacity(self):
+        # Given
+        xs = [3.9 - 0.05 * k for k in range(70)]
+
+        # When
+        for x in xs:
+            # always lands on the first segment, right after the first vertex
+            self.press_key("i", x, 0)
+
+        # Then
+        self.assertGreater(len(self.poly.xy), 64)
+        inserted = [(x, 0) for x in reversed(xs)]
+        self.assert_vertices(SQUARE[:1] + inserted + SQUARE[1:] + [(0, 0)])
+        # the polygon still is a view on the grown buffer
+        self.assertTrue(np.shares_memory(self.poly.xy, self.interactor._xy))
+
+    def test_delete(self):
+        # When
+        self.press_key("d", 4, 4)
+
+        # Then
+        self.assert_vertices([(0, 0), (4, 0), (0, 4), (0, 0)])
+
+    def test_first_and_last_vertex_stay_equal(self):
+        # When
+        self.press_key("i", 2, 0)
+        self.drag((0, 0), (-0.2, -0.3))
+        self.press_key("d", 4, 4)
+
+        # Then
+        self.assert_vertices([(-0.2, -0.3), (2, 0), (4, 0), (0, 4), (-0.2, -0.3)])
+
+    def test_display_coords_follow_edits_and_view(self):
+        def assert_display_coords_up_to_date():
+            np.testing.assert_allclose(
+                self.interactor._display_coords(),
+                self.poly.get_transform().transform(self.poly.xy),
+            )
+
+        # When
+        self.drag((4, 4), (4.2, 3.9))
+
+        # Then
+        # patched in place during the drag
+        self.assertIsNotNone(self.interactor._xyt)
+        assert_display_coords_up_to_date()
+
+        # When
+        self.press_key("i", 2, 0)
+
+        # Then
+        assert_display_coords_up_to_date()
+
+        # When
+        self.ax.set_xlim(-1, 5)
+
+        # Then
+        assert_display_coords_up_to_date()
+
+    def test_segments_follow_drag_of_first_vertex(self):
+        # Given
+        # an insertion attempt far from the edges caches the segments
+        self.press_key("i", 2, 2)
+        self.assertIsNotNone(self.interactor._seg_v)
+
+        # When
+        # the first vertex is also the last one
+        self.drag((0, 0), (-0.2, 0.3))
+
+        # Then
+        # patched in place during the drag
+        self.assertIsNotNone(self.interactor._seg_v)
+        v = np.diff(self.poly.get_transform().transform(self.poly.xy), axis=0)
+        np.testing.assert_allclose(self.interactor._seg_v, v)
+        np.testing.assert_allclose(self.interactor._seg_c2, (v**2).sum(axis=1))
@@ -7,7 +7,7 @@ VERSION = "0.1.0.dev0"
 
 
 def get_requirements():
-    return ["matplotlib", "numpy", "shapely", "traits"]
+    return ["matplotlib", "numpy", "shapely>=2.0", "traits"]
 
 
 def get_dev_requirements():
@@ -42,7 +42,7 @@ def main():
             "License :: OSI Approved :: MIT License",
             "Operating System :: OS Independent",
         ],
-        python_requires=">=3.6",
+        python_requires=">=3.7",
         install_requires=get_requirements(),
         extras_require={"dev": get_dev_requirements()},
     )